@@ -4,83 +4,213 @@ Script completo para a resolução da AC02 de Computação Gráfica.
 
 Este ficheiro implementa as principais transformações geométricas 2D
 (translação, escala, rotação, reflexão e cisalhamento) utilizando uma
-abordagem profissional com Programação Orientada a Objetos e coordenadas
-homogêneas, permitindo a aplicação de transformações através de multiplicação
-de matrizes.
+abordagem profissional com Programação Orientada a Objetos e matrizes afins
+2x3 (o bloco útil das coordenadas homogêneas), permitindo a aplicação de
+transformações através de multiplicação de matrizes.
 
 O script está dividido em:
 1. Funções para criar matrizes de transformação.
 2. A classe `FormaGeometrica` que representa os objetos.
-3. Funções de plotagem para visualizar os resultados.
-4. Funções dedicadas para resolver cada um dos 10 exercícios.
-5. A função `main` que orquestra a execução de todos os exercícios.
+3. A classe `LoteTransformacoes` que agrupa e aplica as transformações.
+4. Funções de plotagem para visualizar os resultados.
+5. Funções dedicadas para resolver cada um dos 10 exercícios.
+6. A função `main` que orquestra a execução de todos os exercícios.
 """
+import math
+import os
+import sys
+from functools import lru_cache, reduce
+from itertools import accumulate
+
 import numpy as np
+import matplotlib
+
+# Em execuções não interativas (saída redirecionada ou HEADLESS definido), o
+# backend Agg dispensa o arranque e o ciclo de eventos da GUI; os gráficos
+# são gravados em PNG em vez de bloquear em plt.show()
+_INTERATIVO = sys.stdout.isatty() and not os.environ.get("HEADLESS")
+if not _INTERATIVO:
+    matplotlib.use("Agg")
+
 import matplotlib.pyplot as plt
+from matplotlib.patches import Polygon
 from typing import List, Tuple, Union
 
+try:
+    import numba
+except ImportError:
+    numba = None
+
+
+# --- Núcleo funcional de aplicação de transformações ---
+#
+# Toda a matriz produzida neste módulo tem última linha [0, 0, 1], pelo que o
+# produto homogéneo completo se reduz ao bloco linear 2x2 mais a coluna de
+# translação — 4 multiplicações por ponto em vez de 9, sem aumentar os pontos
+# com a coordenada homogénea. Para os conjuntos minúsculos dos exercícios
+# (N <= 4), o despacho do `np.matmul` para a BLAS custa mais do que a própria
+# conta; quando o numba está disponível, um kernel JIT desenrolado elimina
+# esse despacho; caso contrário, cai-se no produto NumPy normal.
+
+if numba is not None:
+    @numba.njit(cache=True, fastmath=True)
+    def _aplicar_afim_pequeno(matriz: np.ndarray, pontos: np.ndarray) -> np.ndarray:
+        saida = np.empty_like(pontos)
+        for i in range(pontos.shape[0]):
+            x, y = pontos[i, 0], pontos[i, 1]
+            saida[i, 0] = matriz[0, 0] * x + matriz[0, 1] * y + matriz[0, 2]
+            saida[i, 1] = matriz[1, 0] * x + matriz[1, 1] * y + matriz[1, 2]
+        return saida
+
+    # Aquecimento: compila o kernel já na importação, para o custo do JIT
+    # não cair em cima do primeiro exercício
+    _aplicar_afim_pequeno(np.eye(2, 3, dtype=np.float32), np.ones((1, 2), dtype=np.float32))
+else:
+    _aplicar_afim_pequeno = None
+
+# Abaixo deste número de pontos o kernel desenrolado ganha ao np.matmul
+_LIMIAR_KERNEL_PEQUENO = 64
+
+# Os resultados servem apenas para impressão arredondada e plotagem, pelo que
+# float32 chega de sobra e corta para metade a largura de banda dos buffers
+DTYPE = np.float32
+
+
+def aplicar_afim(matriz: np.ndarray, pontos: np.ndarray) -> np.ndarray:
+    """Aplica uma transformação afim 2x3 a pontos (N, 2) crus.
+
+    Núcleo funcional usado por todos os caminhos quentes; a classe
+    `FormaGeometrica` fica apenas como invólucro para impressão e plotagem.
+    """
+    if _aplicar_afim_pequeno is not None and pontos.shape[0] < _LIMIAR_KERNEL_PEQUENO:
+        return _aplicar_afim_pequeno(np.asarray(matriz, dtype=DTYPE),
+                                     np.ascontiguousarray(pontos, dtype=DTYPE))
+    return pontos @ matriz[:, :2].T + matriz[:, 2]
+
+
+# --- Funções para criar Matrizes de Transformação Afim (2x3) ---
+#
+# A última linha [0, 0, 1] de uma matriz homogénea é invariante para todas as
+# transformações deste módulo, pelo que só o bloco afim (2, 3) é guardado e
+# multiplicado — 33% menos tráfego de memória em cada matriz e composição.
+
+_IDENTIDADE = np.eye(2, 3, dtype=DTYPE)
+_IDENTIDADE.setflags(write=False)
 
-# --- Funções para criar Matrizes de Transformação Homogênea (3x3) ---
 
 def matriz_translacao(vetor: Union[List, np.ndarray]) -> np.ndarray:
-    """Cria uma matriz de translação 3x3."""
-    dx, dy = vetor
-    return np.array([
-        [1, 0, dx],
-        [0, 1, dy],
-        [0, 0, 1]
-    ])
+    """Cria uma matriz de translação afim 2x3."""
+    # Cópia do molde identidade com a coluna de translação preenchida,
+    # como no caminho do cisalhamento
+    matriz = _IDENTIDADE.copy()
+    matriz[0, 2], matriz[1, 2] = vetor
+    return matriz
 
 
 def matriz_escala(fatores: Union[float, List, np.ndarray], origem: Tuple[float, float] = (0, 0)) -> np.ndarray:
-    """Cria uma matriz de escala 3x3 em relação a uma origem."""
-    sx, sy = fatores if isinstance(fatores, (list, np.ndarray)) else (fatores, fatores)
+    """Cria uma matriz de escala afim 2x3 em relação a uma origem."""
+    # Normalização sem ramos: escalar ou par, tudo acaba difundido para (2,)
+    sx, sy = np.broadcast_to(np.atleast_1d(np.asarray(fatores, dtype=DTYPE)), (2,))
     ox, oy = origem
-    # Move para a origem, escala, e move de volta
-    return matriz_translacao([ox, oy]) @ np.array([[sx, 0, 0], [0, sy, 0], [0, 0, 1]]) @ matriz_translacao([-ox, -oy])
+    # Forma fechada de T(origem) @ S @ T(-origem), sem multiplicações intermédias
+    tx = ox * (1 - sx)
+    ty = oy * (1 - sy)
+    return np.array([
+        [sx, 0, tx],
+        [0, sy, ty]
+    ], dtype=DTYPE)
 
 
 def matriz_rotacao(angulo_graus: float, origem: Tuple[float, float] = (0, 0)) -> np.ndarray:
-    """Cria uma matriz de rotação 3x3 em relação a uma origem."""
-    angulo_rad = np.radians(angulo_graus)
-    c, s = np.cos(angulo_rad), np.sin(angulo_rad)
+    """Cria uma matriz de rotação afim 2x3 em relação a uma origem."""
+    # Funções escalares do `math`: sem o custo de despacho das ufuncs do NumPy
+    angulo_rad = math.radians(angulo_graus)
+    c, s = math.cos(angulo_rad), math.sin(angulo_rad)
     ox, oy = origem
-    # Move para a origem, rotaciona, e move de volta
-    return matriz_translacao([ox, oy]) @ np.array([[c, -s, 0], [s, c, 0], [0, 0, 1]]) @ matriz_translacao([-ox, -oy])
+    # Forma fechada de T(origem) @ R @ T(-origem), sem multiplicações intermédias
+    tx = ox - c * ox + s * oy
+    ty = oy - s * ox - c * oy
+    return np.array([
+        [c, -s, tx],
+        [s, c, ty]
+    ], dtype=DTYPE)
+
+
+# As reflexões só têm duas saídas possíveis, e os cisalhamentos dois moldes:
+# pré-calculados uma vez ao importar o módulo, em vez de alocar um np.array
+# novo a cada chamada. As reflexões são devolvidas como vistas só de leitura.
+_REFLEXOES = {
+    'y': np.array([[-1, 0, 0], [0, 1, 0]], dtype=DTYPE),
+    'x': np.array([[1, 0, 0], [0, -1, 0]], dtype=DTYPE),
+}
+for _matriz in _REFLEXOES.values():
+    _matriz.setflags(write=False)
+
+# Posição (linha, coluna) onde cada direção de cisalhamento coloca o fator k
+_CISALHAMENTO_POSICAO = {'horizontal': (0, 1), 'vertical': (1, 0)}
 
 
 def matriz_reflexao(eixo: str = 'y') -> np.ndarray:
-    """Cria uma matriz de reflexão 3x3."""
-    if eixo == 'y': return np.array([[-1, 0, 0], [0, 1, 0], [0, 0, 1]])
-    if eixo == 'x': return np.array([[1, 0, 0], [0, -1, 0], [0, 0, 1]])
-    raise ValueError("O eixo deve ser 'x' ou 'y'")
+    """Cria uma matriz de reflexão afim 2x3."""
+    try:
+        return _REFLEXOES[eixo]
+    except KeyError:
+        raise ValueError("O eixo deve ser 'x' ou 'y'") from None
+
+
+def _compor_par(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Compõe duas matrizes afins 2x3 (aplica-se primeiro `b`, depois `a`).
+
+    Equivale ao produto homogéneo 3x3, preservando a estrutura afim sem
+    materializar a linha [0, 0, 1].
+    """
+    composta = a[:, :2] @ b
+    composta[:, 2] += a[:, 2]
+    return composta
+
+
+def compor_matrizes(matrizes: List[np.ndarray]) -> np.ndarray:
+    """Compõe uma sequência de transformações numa única matriz afim 2x3.
+
+    As matrizes são dadas na ordem de aplicação, pelo que a composição é
+    feita da direita para a esquerda.
+    """
+    return reduce(lambda b, a: _compor_par(a, b), matrizes)
 
 
 def matriz_cisalhamento(k: float, direcao: str = 'horizontal') -> np.ndarray:
-    """Cria uma matriz de cisalhamento 3x3."""
-    if direcao == 'horizontal': return np.array([[1, k, 0], [0, 1, 0], [0, 0, 1]])
-    if direcao == 'vertical': return np.array([[1, 0, 0], [k, 1, 0], [0, 0, 1]])
-    raise ValueError("A direção deve ser 'horizontal' ou 'vertical'")
+    """Cria uma matriz de cisalhamento afim 2x3."""
+    try:
+        linha, coluna = _CISALHAMENTO_POSICAO[direcao]
+    except KeyError:
+        raise ValueError("A direção deve ser 'horizontal' ou 'vertical'") from None
+    matriz = _IDENTIDADE.copy()
+    matriz[linha, coluna] = k
+    return matriz
 
 
 # --- Classe Principal FormaGeometrica ---
 
 class FormaGeometrica:
     def __init__(self, pontos: np.ndarray, nome: str = "Forma"):
-        pontos_2d = np.atleast_2d(pontos)
-        self.pontos_homogeneos = np.hstack([pontos_2d, np.ones((pontos_2d.shape[0], 1))])
+        # Sem coluna homogénea: com as matrizes afins 2x3, basta guardar as
+        # coordenadas (N, 2) em DTYPE (os exercícios passam inteiros)
+        self._pontos = np.array(np.atleast_2d(pontos), dtype=DTYPE)
         self.nome = nome
 
     @property
     def pontos(self) -> np.ndarray:
-        return self.pontos_homogeneos[:, :2]
+        return self._pontos
 
     def __repr__(self) -> str:
         return f"{self.nome}(pontos=\n{self.pontos})"
 
     def aplicar_matriz(self, matriz: np.ndarray, novo_nome: str) -> 'FormaGeometrica':
-        novos_pontos_homogeneos = (matriz @ self.pontos_homogeneos.T).T
-        return FormaGeometrica(novos_pontos_homogeneos[:, :2], novo_nome)
+        return FormaGeometrica(aplicar_afim(matriz, self.pontos), novo_nome)
+
+    def aplicar_matrizes(self, matrizes: List[np.ndarray], novo_nome: str) -> 'FormaGeometrica':
+        """Aplica uma sequência de transformações fundida numa única matriz."""
+        return self.aplicar_matriz(compor_matrizes(matrizes), novo_nome)
 
     def transladar(self, vetor: Union[List, np.ndarray]) -> 'FormaGeometrica':
         return self.aplicar_matriz(matriz_translacao(vetor), f"{self.nome} transladado")
@@ -99,8 +229,93 @@ class FormaGeometrica:
         return self.aplicar_matriz(matriz_cisalhamento(k, direcao), f"{self.nome} cisalhado")
 
 
+# --- Classe LoteTransformacoes ---
+
+class LoteTransformacoes:
+    """Acumula as transformações de todos os exercícios e aplica-as de uma vez.
+
+    Cada aplicação individual de uma matriz afim a N <= 4 pontos gasta mais tempo no
+    despacho Python/BLAS do que na conta em si. Para amortizar esse custo, os
+    exercícios apenas agendam pares (forma, matriz); `executar` empilha tudo
+    num único `np.einsum` em lote e só depois os resultados são consultados.
+    """
+
+    def __init__(self):
+        self._formas: List[FormaGeometrica] = []
+        self._matrizes: List[np.ndarray] = []
+        self._nomes: List[str] = []
+        self._resultados: List[FormaGeometrica] = []
+
+    def agendar(self, forma: FormaGeometrica, matriz: np.ndarray, novo_nome: str):
+        """Regista uma transformação pendente e devolve um acessor do resultado."""
+        indice = len(self._formas)
+        self._formas.append(forma)
+        self._matrizes.append(matriz)
+        self._nomes.append(novo_nome)
+        return lambda: self._resultados[indice]
+
+    def executar(self):
+        """Aplica todas as transformações agendadas numa única multiplicação.
+
+        Os conjuntos de pontos são empilhados num buffer (K, Nmax, 2) com
+        preenchimento por zeros, as matrizes num buffer (K, 2, 3), e um único
+        `einsum` sobre os blocos lineares 2x2 mais a soma das translações
+        substitui as K multiplicações pequenas. Um vetor de contagens recupera
+        os pontos válidos de cada exercício no final.
+        """
+        if not self._formas:
+            return
+        contagens = [forma.pontos.shape[0] for forma in self._formas]
+        n_max = max(contagens)
+        pontos = np.zeros((len(self._formas), n_max, 2), dtype=DTYPE)
+        for i, forma in enumerate(self._formas):
+            pontos[i, :contagens[i], :] = forma.pontos
+        matrizes = np.stack(self._matrizes).astype(DTYPE)
+        transformados = (np.einsum("kij,knj->kni", matrizes[:, :, :2], pontos)
+                         + matrizes[:, None, :, 2])
+        self._resultados = [
+            FormaGeometrica(transformados[i, :contagens[i]], self._nomes[i])
+            for i in range(len(self._formas))
+        ]
+
+
 # --- Funções de Plotagem ---
 
+# Estilos de linha dos passos das transformações compostas
+_ESTILOS_PASSOS = ('-', '--', '-.', ':')
+
+
+@lru_cache(maxsize=8)
+def _cores_passos(n: int) -> np.ndarray:
+    """Devolve (e memoriza) as n cores do viridis usadas nos passos."""
+    return plt.cm.viridis(np.linspace(0, 1, n))
+
+
+def _fixar_limites(ax, conjuntos_pontos: List[np.ndarray]):
+    """Fixa os limites do eixo a partir da união dos pontos, com margem de 1.
+
+    Com os limites definidos à partida e o autoscale desligado, o matplotlib
+    deixa de recalcular a vista a cada camada desenhada.
+    """
+    todos = np.vstack(conjuntos_pontos)
+    x_min, y_min = todos.min(axis=0) - 1
+    x_max, y_max = todos.max(axis=0) + 1
+    ax.set_autoscale_on(False)
+    ax.set_xlim(x_min, x_max)
+    ax.set_ylim(y_min, y_max)
+
+
+def _desenhar_poligono(ax, pontos: np.ndarray, cor, estilo_linha: str, label: str, zorder: int = 2):
+    """Desenha um polígono fechado com marcadores nos vértices.
+
+    Usa um `Polygon` com `closed=True` em vez de repetir o primeiro vértice
+    num buffer copiado, evitando uma alocação por polígono desenhado.
+    """
+    ax.add_patch(Polygon(pontos, closed=True, fill=False, edgecolor=cor,
+                         linestyle=estilo_linha, label=label, zorder=zorder))
+    ax.scatter(pontos[:, 0], pontos[:, 1], color=cor, marker='o', zorder=zorder)
+
+
 def configurar_plot(ax, titulo: str):
     ax.axhline(0, color='black', linewidth=0.5)
     ax.axvline(0, color='black', linewidth=0.5)
@@ -111,198 +326,258 @@ def configurar_plot(ax, titulo: str):
     ax.set_ylabel("Eixo Y")
 
 
-def plotar_transformacao(original: FormaGeometrica, transformada: FormaGeometrica, titulo: str):
-    fig, ax = plt.subplots(figsize=(8, 8))
+def plotar_transformacao(original: FormaGeometrica, transformada: FormaGeometrica, titulo: str, ax=None):
+    # Sem eixo pré-atribuído, cria-se uma figura própria e mostra-se logo
+    # (comportamento antigo); com eixo, desenha-se na grelha partilhada
+    figura_propria = ax is None
+    if figura_propria:
+        fig, ax = plt.subplots(figsize=(8, 8))
+    _fixar_limites(ax, [original.pontos, transformada.pontos])
 
     if original.pontos.shape[0] > 1:
-        pontos_plot = np.vstack([original.pontos, original.pontos[0]])
-        ax.plot(pontos_plot[:, 0], pontos_plot[:, 1], 'o-', label="Original", color='blue')
+        _desenhar_poligono(ax, original.pontos, 'blue', '-', "Original")
     else:
         ax.scatter(original.pontos[:, 0], original.pontos[:, 1], s=100, label="Original", color='blue', zorder=5)
 
     if transformada.pontos.shape[0] > 1:
-        pontos_plot = np.vstack([transformada.pontos, transformada.pontos[0]])
-        ax.plot(pontos_plot[:, 0], pontos_plot[:, 1], 'o--', label="Transformada", color='red')
+        _desenhar_poligono(ax, transformada.pontos, 'red', '--', "Transformada")
     else:
         ax.scatter(transformada.pontos[:, 0], transformada.pontos[:, 1], s=100, label="Transformada", color='red',
                    zorder=5)
 
     configurar_plot(ax, titulo)
     ax.legend()
-    plt.show()
+    if figura_propria:
+        plt.show()
 
 
-def plotar_transformacao_composta(titulo: str, passos: List[FormaGeometrica]):
-    fig, ax = plt.subplots(figsize=(8, 8))
-    cores = plt.cm.viridis(np.linspace(0, 1, len(passos)))
-    estilos = ['o-', 'o--', 'o-.', 'o:']
+def plotar_transformacao_composta(titulo: str, passos: List[FormaGeometrica], ax=None):
+    figura_propria = ax is None
+    if figura_propria:
+        fig, ax = plt.subplots(figsize=(8, 8))
+    _fixar_limites(ax, [forma.pontos for forma in passos])
+    cores = _cores_passos(len(passos))
 
     for i, forma in enumerate(passos):
         label = f"Passo {i}: {forma.nome}" if i > 0 else "Original"
         cor = cores[i]
-        estilo = estilos[i % len(estilos)]
+        estilo = _ESTILOS_PASSOS[i % len(_ESTILOS_PASSOS)]
 
         if forma.pontos.shape[0] > 1:
-            pontos_plot = np.vstack([forma.pontos, forma.pontos[0]])
-            ax.plot(pontos_plot[:, 0], pontos_plot[:, 1], estilo, label=label, color=cor, zorder=i + 5)
+            _desenhar_poligono(ax, forma.pontos, cor, estilo, label, zorder=i + 5)
         else:
             ax.scatter(forma.pontos[:, 0], forma.pontos[:, 1], s=100 + i * 20, label=label, color=cor, zorder=i + 5)
 
     configurar_plot(ax, titulo)
-    ax.legend(loc='upper left', bbox_to_anchor=(1, 1))
-    fig.tight_layout()
-    plt.show()
+    if figura_propria:
+        ax.legend(loc='upper left', bbox_to_anchor=(1, 1))
+        fig.tight_layout()
+        plt.show()
+    else:
+        # Na grelha partilhada a legenda fica dentro do próprio eixo
+        ax.legend(loc='upper left', fontsize='small')
 
 
 # --- Resolução dos Exercícios ---
+#
+# Cada função `resolver_exercicio_*` apenas agenda as suas transformações no
+# lote partilhado e devolve uma função `finalizar` que imprime e plota os
+# resultados depois de `LoteTransformacoes.executar` processar tudo de uma vez.
 
-def resolver_exercicio_1():
-    """Resolve e plota o Exercício 1: Translação Simples."""
-    print("--- Exercício 1: Translação Simples ---")
-    print("Dado o ponto P(2, 3), aplica-se a translação com vetor (4, -2).\n")
-
+def resolver_exercicio_1(lote: LoteTransformacoes, ax=None):
+    """Prepara o Exercício 1: Translação Simples."""
     ponto_original = FormaGeometrica(np.array([2, 3]), "P(2, 3)")
-    ponto_transformado = ponto_original.transladar([4, -2])
+    transformado = lote.agendar(ponto_original, matriz_translacao([4, -2]), "P(2, 3) transladado")
 
-    print(f"Resultado:\nCoordenadas Finais: {ponto_transformado.pontos}\n")
-    plotar_transformacao(ponto_original, ponto_transformado, "Exercício 1: Translação Simples")
+    def finalizar():
+        print("--- Exercício 1: Translação Simples ---")
+        print("Dado o ponto P(2, 3), aplica-se a translação com vetor (4, -2).\n")
+        ponto_transformado = transformado()
+        print(f"Resultado:\nCoordenadas Finais: {ponto_transformado.pontos}\n")
+        plotar_transformacao(ponto_original, ponto_transformado, "Exercício 1: Translação Simples", ax=ax)
 
+    return finalizar
 
-def resolver_exercicio_2():
-    """Resolve e plota o Exercício 2: Escala Uniforme."""
-    print("\n--- Exercício 2: Escala Uniforme ---")
-    print("Aplica-se uma escala uniforme de fator 2 ao triângulo A(1, 1), B(3, 1), C(2, 4).\n")
 
+def resolver_exercicio_2(lote: LoteTransformacoes, ax=None):
+    """Prepara o Exercício 2: Escala Uniforme."""
     triangulo_original = FormaGeometrica(np.array([[1, 1], [3, 1], [2, 4]]), "Triângulo Original")
-    triangulo_transformado = triangulo_original.escalar(2)
+    transformado = lote.agendar(triangulo_original, matriz_escala(2), "Triângulo Original escalado")
 
-    print(f"Resultado:\nNovos vértices:\n{triangulo_transformado.pontos}\n")
-    plotar_transformacao(triangulo_original, triangulo_transformado, "Exercício 2: Escala Uniforme")
+    def finalizar():
+        print("\n--- Exercício 2: Escala Uniforme ---")
+        print("Aplica-se uma escala uniforme de fator 2 ao triângulo A(1, 1), B(3, 1), C(2, 4).\n")
+        triangulo_transformado = transformado()
+        print(f"Resultado:\nNovos vértices:\n{triangulo_transformado.pontos}\n")
+        plotar_transformacao(triangulo_original, triangulo_transformado, "Exercício 2: Escala Uniforme", ax=ax)
 
+    return finalizar
 
-def resolver_exercicio_3():
-    """Resolve e plota o Exercício 3: Escala Não Uniforme."""
-    print("\n--- Exercício 3: Escala Não Uniforme ---")
-    print("Aplica-se uma escala com fatores (x=2, y=0.5) ao mesmo triângulo.\n")
 
+def resolver_exercicio_3(lote: LoteTransformacoes, ax=None):
+    """Prepara o Exercício 3: Escala Não Uniforme."""
     triangulo_original = FormaGeometrica(np.array([[1, 1], [3, 1], [2, 4]]), "Triângulo Original")
-    triangulo_transformado = triangulo_original.escalar([2, 0.5])
+    transformado = lote.agendar(triangulo_original, matriz_escala([2, 0.5]), "Triângulo Original escalado")
 
-    print(f"Resultado:\nNovos vértices:\n{triangulo_transformado.pontos}\n")
-    plotar_transformacao(triangulo_original, triangulo_transformado, "Exercício 3: Escala Não Uniforme")
+    def finalizar():
+        print("\n--- Exercício 3: Escala Não Uniforme ---")
+        print("Aplica-se uma escala com fatores (x=2, y=0.5) ao mesmo triângulo.\n")
+        triangulo_transformado = transformado()
+        print(f"Resultado:\nNovos vértices:\n{triangulo_transformado.pontos}\n")
+        plotar_transformacao(triangulo_original, triangulo_transformado, "Exercício 3: Escala Não Uniforme", ax=ax)
 
+    return finalizar
 
-def resolver_exercicio_4():
-    """Resolve e plota o Exercício 4: Rotação na Origem."""
-    print("\n--- Exercício 4: Rotação na Origem ---")
-    print("Rotaciona-se o ponto P(1, 0) em 90° no sentido anti-horário.\n")
 
+def resolver_exercicio_4(lote: LoteTransformacoes, ax=None):
+    """Prepara o Exercício 4: Rotação na Origem."""
     ponto_original = FormaGeometrica(np.array([1, 0]), "P(1, 0)")
-    ponto_transformado = ponto_original.rotacionar(90)
+    transformado = lote.agendar(ponto_original, matriz_rotacao(90), "P(1, 0) rotacionado")
 
-    print(f"Resultado:\nCoordenadas Finais: {np.round(ponto_transformado.pontos, 5)}\n")
-    plotar_transformacao(ponto_original, ponto_transformado, "Exercício 4: Rotação 90° Anti-horário")
+    def finalizar():
+        print("\n--- Exercício 4: Rotação na Origem ---")
+        print("Rotaciona-se o ponto P(1, 0) em 90° no sentido anti-horário.\n")
+        ponto_transformado = transformado()
+        print(f"Resultado:\nCoordenadas Finais: {np.round(ponto_transformado.pontos, 5)}\n")
+        plotar_transformacao(ponto_original, ponto_transformado, "Exercício 4: Rotação 90° Anti-horário", ax=ax)
 
+    return finalizar
 
-def resolver_exercicio_5():
-    """Resolve e plota o Exercício 5: Rotação de um Polígono."""
-    print("\n--- Exercício 5: Rotação de um Polígono ---")
-    print("Rotaciona-se um quadrado em 45° no sentido horário.\n")
 
+def resolver_exercicio_5(lote: LoteTransformacoes, ax=None):
+    """Prepara o Exercício 5: Rotação de um Polígono."""
     quadrado_original = FormaGeometrica(np.array([[1, 1], [1, 4], [4, 4], [4, 1]]), "Quadrado Original")
-    quadrado_transformado = quadrado_original.rotacionar(-45)  # Ângulo negativo para sentido horário
+    # Ângulo negativo para sentido horário
+    transformado = lote.agendar(quadrado_original, matriz_rotacao(-45), "Quadrado Original rotacionado")
 
-    print(f"Resultado:\nNovos vértices:\n{np.round(quadrado_transformado.pontos, 5)}\n")
-    plotar_transformacao(quadrado_original, quadrado_transformado, "Exercício 5: Rotação 45° Horário")
+    def finalizar():
+        print("\n--- Exercício 5: Rotação de um Polígono ---")
+        print("Rotaciona-se um quadrado em 45° no sentido horário.\n")
+        quadrado_transformado = transformado()
+        print(f"Resultado:\nNovos vértices:\n{np.round(quadrado_transformado.pontos, 5)}\n")
+        plotar_transformacao(quadrado_original, quadrado_transformado, "Exercício 5: Rotação 45° Horário", ax=ax)
 
+    return finalizar
 
-def resolver_exercicio_6():
-    """Resolve e plota o Exercício 6: Reflexão Simples."""
-    print("\n--- Exercício 6: Reflexão Simples ---")
-    print("Reflete-se o ponto P(2, 5) em relação ao eixo Y.\n")
 
+def resolver_exercicio_6(lote: LoteTransformacoes, ax=None):
+    """Prepara o Exercício 6: Reflexão Simples."""
     ponto_original = FormaGeometrica(np.array([2, 5]), "P(2, 5)")
-    ponto_transformado = ponto_original.refletir(eixo='y')
+    transformado = lote.agendar(ponto_original, matriz_reflexao(eixo='y'), "P(2, 5) refletido")
 
-    print(f"Resultado:\nCoordenadas Finais: {ponto_transformado.pontos}\n")
-    plotar_transformacao(ponto_original, ponto_transformado, "Exercício 6: Reflexão no Eixo Y")
+    def finalizar():
+        print("\n--- Exercício 6: Reflexão Simples ---")
+        print("Reflete-se o ponto P(2, 5) em relação ao eixo Y.\n")
+        ponto_transformado = transformado()
+        print(f"Resultado:\nCoordenadas Finais: {ponto_transformado.pontos}\n")
+        plotar_transformacao(ponto_original, ponto_transformado, "Exercício 6: Reflexão no Eixo Y", ax=ax)
 
+    return finalizar
 
-def resolver_exercicio_7():
-    """Resolve e plota o Exercício 7: Reflexão de um Triângulo."""
-    print("\n--- Exercício 7: Reflexão de um Triângulo ---")
-    print("Reflete-se o triângulo A(2,3), B(4,3), C(3,5) em relação ao eixo X.\n")
 
+def resolver_exercicio_7(lote: LoteTransformacoes, ax=None):
+    """Prepara o Exercício 7: Reflexão de um Triângulo."""
     triangulo_original = FormaGeometrica(np.array([[2, 3], [4, 3], [3, 5]]), "Triângulo Original")
-    triangulo_transformado = triangulo_original.refletir(eixo='x')
+    transformado = lote.agendar(triangulo_original, matriz_reflexao(eixo='x'), "Triângulo Original refletido")
 
-    print(f"Resultado:\nNovos vértices:\n{triangulo_transformado.pontos}\n")
-    plotar_transformacao(triangulo_original, triangulo_transformado, "Exercício 7: Reflexão no Eixo X")
+    def finalizar():
+        print("\n--- Exercício 7: Reflexão de um Triângulo ---")
+        print("Reflete-se o triângulo A(2,3), B(4,3), C(3,5) em relação ao eixo X.\n")
+        triangulo_transformado = transformado()
+        print(f"Resultado:\nNovos vértices:\n{triangulo_transformado.pontos}\n")
+        plotar_transformacao(triangulo_original, triangulo_transformado, "Exercício 7: Reflexão no Eixo X", ax=ax)
 
+    return finalizar
 
-def resolver_exercicio_8():
-    """Resolve e plota o Exercício 8: Cisalhamento Horizontal."""
-    print("\n--- Exercício 8: Cisalhamento Horizontal ---")
-    print("Aplica-se um cisalhamento horizontal com k=2 ao ponto P(2, 3).\n")
 
+def resolver_exercicio_8(lote: LoteTransformacoes, ax=None):
+    """Prepara o Exercício 8: Cisalhamento Horizontal."""
     ponto_original = FormaGeometrica(np.array([2, 3]), "P(2, 3)")
-    ponto_transformado = ponto_original.cisalhar(k=2, direcao='horizontal')
+    transformado = lote.agendar(ponto_original, matriz_cisalhamento(k=2, direcao='horizontal'),
+                                "P(2, 3) cisalhado")
 
-    print(f"Resultado:\nCoordenadas Finais: {ponto_transformado.pontos}\n")
-    plotar_transformacao(ponto_original, ponto_transformado, "Exercício 8: Cisalhamento Horizontal (k=2)")
+    def finalizar():
+        print("\n--- Exercício 8: Cisalhamento Horizontal ---")
+        print("Aplica-se um cisalhamento horizontal com k=2 ao ponto P(2, 3).\n")
+        ponto_transformado = transformado()
+        print(f"Resultado:\nCoordenadas Finais: {ponto_transformado.pontos}\n")
+        plotar_transformacao(ponto_original, ponto_transformado, "Exercício 8: Cisalhamento Horizontal (k=2)", ax=ax)
 
+    return finalizar
 
-def resolver_exercicio_9():
-    """Resolve e plota o Exercício 9: Composição de Transformações."""
-    print("\n--- Exercício 9: Composição de Transformações ---")
-    print("Aplica-se ao ponto P(3, 2) a sequência:\n"
-          "1. Translação com vetor (1, -1)\n"
-          "2. Rotação de 90° no sentido anti-horário\n"
-          "3. Escala uniforme com fator 2\n")
 
+def resolver_exercicio_9(lote: LoteTransformacoes, ax=None):
+    """Prepara o Exercício 9: Composição de Transformações."""
     ponto_original = FormaGeometrica(np.array([3, 2]), "Original")
-    passo_1 = ponto_original.transladar([1, -1])
-    passo_2 = passo_1.rotacionar(90)
-    passo_3_final = passo_2.escalar(2)
 
-    print(f"Resultado:\nPasso 1 (Translação): {passo_1.pontos}"
-          f"\nPasso 2 (Rotação): {np.round(passo_2.pontos, 5)}"
-          f"\nPasso 3 (Final): {np.round(passo_3_final.pontos, 5)}\n")
-
-    plotar_transformacao_composta(
-        "Exercício 9: Composição de Transformações",
-        [ponto_original, passo_1, passo_2, passo_3_final]
+    # Os produtos parciais da cadeia fundida dão as matrizes acumuladas de
+    # cada passo, sempre sobre o ponto original — os três resultados saem do
+    # mesmo lote.
+    m_passo_1, m_passo_2, m_passo_3 = accumulate(
+        [matriz_translacao([1, -1]), matriz_rotacao(90), matriz_escala(2)],
+        lambda acumulada, matriz: _compor_par(matriz, acumulada)
     )
-
-
-def resolver_exercicio_10():
-    """Resolve e plota o Exercício 10: Combinação de Transformações."""
-    print("\n--- Exercício 10: Combinação de Transformações ---")
-    print("Aplica-se ao retângulo A(1,1), B(5,1), C(5,3), D(1,3) a sequência:\n"
-          "1. Translação com vetor (-2, 3)\n"
-          "2. Escala não uniforme com fatores (1.5, 0.5)\n"
-          "3. Reflexão em relação ao eixo Y\n")
-
+    passo_1 = lote.agendar(ponto_original, m_passo_1, "Original transladado")
+    passo_2 = lote.agendar(ponto_original, m_passo_2, "Original transladado rotacionado")
+    passo_3 = lote.agendar(ponto_original, m_passo_3, "Original transladado rotacionado escalado")
+
+    def finalizar():
+        print("\n--- Exercício 9: Composição de Transformações ---")
+        print("Aplica-se ao ponto P(3, 2) a sequência:\n"
+              "1. Translação com vetor (1, -1)\n"
+              "2. Rotação de 90° no sentido anti-horário\n"
+              "3. Escala uniforme com fator 2\n")
+        passo_1_forma, passo_2_forma, passo_3_final = passo_1(), passo_2(), passo_3()
+
+        # Um único round sobre os três passos empilhados, em vez de um por passo
+        arredondados = np.round(np.vstack([passo_1_forma.pontos, passo_2_forma.pontos,
+                                           passo_3_final.pontos]), 5)
+        print(f"Resultado:\nPasso 1 (Translação): {arredondados[:1]}"
+              f"\nPasso 2 (Rotação): {arredondados[1:2]}"
+              f"\nPasso 3 (Final): {arredondados[2:]}\n")
+
+        plotar_transformacao_composta(
+            "Exercício 9: Composição de Transformações",
+            [ponto_original, passo_1_forma, passo_2_forma, passo_3_final],
+            ax=ax
+        )
+
+    return finalizar
+
+
+def resolver_exercicio_10(lote: LoteTransformacoes, ax=None):
+    """Prepara o Exercício 10: Combinação de Transformações."""
     retangulo_original = FormaGeometrica(np.array([[1, 1], [5, 1], [5, 3], [1, 3]]), "Original")
 
-    # Método 1: Calculando a matriz de transformação final (mais eficiente)
-    matriz_final = (
-            matriz_reflexao('y') @
-            matriz_escala([1.5, 0.5]) @
-            matriz_translacao([-2, 3])
+    # Método 1: Calculando a matriz de transformação final (mais eficiente);
+    # os produtos parciais da mesma cadeia dão os passos intermédios.
+    m_passo_1, m_passo_2, matriz_final = accumulate(
+        [matriz_translacao([-2, 3]), matriz_escala([1.5, 0.5]), matriz_reflexao('y')],
+        lambda acumulada, matriz: _compor_par(matriz, acumulada)
     )
-    retangulo_final = retangulo_original.aplicar_matriz(matriz_final, "Final")
-    print(f"Resultado (com matriz composta):\nNovos vértices:\n{np.round(retangulo_final.pontos, 5)}\n")
+    final = lote.agendar(retangulo_original, matriz_final, "Final")
 
-    # Método 2: Aplicando passo a passo para visualização
-    passo_1 = retangulo_original.transladar([-2, 3])
-    passo_2 = passo_1.escalar([1.5, 0.5])
-    passo_3_final = passo_2.refletir(eixo='y')
+    # Método 2: Os passos intermédios para visualização saem do mesmo lote,
+    # cada um com a sua matriz acumulada.
+    passo_1 = lote.agendar(retangulo_original, m_passo_1, "Original transladado")
+    passo_2 = lote.agendar(retangulo_original, m_passo_2, "Original transladado escalado")
 
-    plotar_transformacao_composta(
-        "Exercício 10: Combinação de Transformações",
-        [retangulo_original, passo_1, passo_2, passo_3_final]
-    )
+    def finalizar():
+        print("\n--- Exercício 10: Combinação de Transformações ---")
+        print("Aplica-se ao retângulo A(1,1), B(5,1), C(5,3), D(1,3) a sequência:\n"
+              "1. Translação com vetor (-2, 3)\n"
+              "2. Escala não uniforme com fatores (1.5, 0.5)\n"
+              "3. Reflexão em relação ao eixo Y\n")
+        retangulo_final = final()
+        print(f"Resultado (com matriz composta):\nNovos vértices:\n{np.round(retangulo_final.pontos, 5)}\n")
+
+        plotar_transformacao_composta(
+            "Exercício 10: Combinação de Transformações",
+            [retangulo_original, passo_1(), passo_2(), retangulo_final],
+            ax=ax
+        )
+
+    return finalizar
 
 
 # --- Função Principal para Executar os Exercícios ---
@@ -313,22 +588,49 @@ def main():
     print("Executando AC02 - Transformações Geométricas")
     print("=" * 60)
 
-    resolver_exercicio_1()
-    resolver_exercicio_2()
-    resolver_exercicio_3()
-    resolver_exercicio_4()
-    resolver_exercicio_5()
-    resolver_exercicio_6()
-    resolver_exercicio_7()
-    resolver_exercicio_8()
-    resolver_exercicio_9()
-    resolver_exercicio_10()
+    # Uma única figura com uma grelha 2x5 evita criar Figure+Axes por
+    # exercício e permite um único plt.show() no fim
+    fig, eixos = plt.subplots(2, 5, figsize=(30, 12))
+
+    lote = LoteTransformacoes()
+    exercicios = [
+        resolver_exercicio_1,
+        resolver_exercicio_2,
+        resolver_exercicio_3,
+        resolver_exercicio_4,
+        resolver_exercicio_5,
+        resolver_exercicio_6,
+        resolver_exercicio_7,
+        resolver_exercicio_8,
+        resolver_exercicio_9,
+        resolver_exercicio_10,
+    ]
+    finalizadores = [
+        resolver(lote, ax) for resolver, ax in zip(exercicios, eixos.flat)
+    ]
+
+    # Uma única passagem em lote aplica todas as transformações agendadas.
+    lote.executar()
+    for finalizar in finalizadores:
+        finalizar()
 
     print("\n" + "=" * 60)
     print("Todos os exercícios foram executados.")
-    print("Pode fechar as janelas dos gráficos para terminar o programa.")
+    if _INTERATIVO:
+        print("Pode fechar a janela dos gráficos para terminar o programa.")
+    else:
+        print("Gráficos gravados em ac02_resultados.png.")
     print("=" * 60)
 
+    fig.tight_layout()
+    if _INTERATIVO:
+        plt.show()
+    else:
+        fig.savefig("ac02_resultados.png", dpi=100)
+        # Fecha também qualquer figura avulsa que um exercício possa ter
+        # criado, para nada ficar pendurado depois da gravação
+        plt.close('all')
+
 
 # --- Ponto de Entrada do Script ---
 if __name__ == "__main__":